@@ -0,0 +1,272 @@
+"""
+Long-running scheduler daemon.
+
+Runs the fetch / parse / normalize / store pipeline on a fixed schedule
+instead of as a cold one-shot process. Between runs the daemon keeps
+warm:
+- the Playwright browser (pages are opened and closed per fetch)
+- the shared httpx HTTP/2 client
+- a single SQLite connection
+
+Each job is a set of URLs refreshed every `interval` seconds plus up to
+`jitter` seconds of random delay. A job never overlaps with itself: if a
+run is still in progress when the next one is due, that tick is skipped.
+
+A small status endpoint is served on localhost:
+- GET /health  -> liveness and uptime
+- GET /status  -> per-job run counters and timings
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import random
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from playwright.async_api import async_playwright, Browser, Playwright
+
+from .fetch_httpx import fetch_html, close_client
+from .fetch_playwright import fetch_stats_html
+from .extract import extract_stats
+from .nba_specs import get_nba_spec
+from .storage import DB_FILENAME, insert_rows
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    """
+    A set of URLs refreshed on a fixed interval.
+    """
+
+    name: str
+    urls: List[str]
+    interval: float
+    jitter: float = 0.0
+    use_playwright: bool = False
+
+
+@dataclass
+class JobStatus:
+    """
+    Run bookkeeping for a single job, reported by /status.
+    """
+
+    runs: int = 0
+    failures: int = 0
+    skipped: int = 0
+    running: bool = False
+    last_started: Optional[float] = None
+    last_finished: Optional[float] = None
+    last_duration: Optional[float] = None
+    last_rows: int = 0
+    last_error: Optional[str] = None
+    next_run: Optional[float] = None
+
+
+class ScraperDaemon:
+    """
+    Schedules jobs and owns the warm browser, HTTP client and storage
+    connection shared between runs.
+    """
+
+    def __init__(
+        self,
+        jobs: List[Job],
+        status_host: str = "127.0.0.1",
+        status_port: int = 8765,
+        headless: bool = True,
+        db_filename: str = DB_FILENAME,
+    ) -> None:
+        if len({job.name for job in jobs}) != len(jobs):
+            raise ValueError("Job names must be unique.")
+        self.jobs = jobs
+        self.status_host = status_host
+        self.status_port = status_port
+        self.headless = headless
+        self.db_filename = db_filename
+        self.status: Dict[str, JobStatus] = {job.name: JobStatus() for job in jobs}
+        self._started_at: Optional[float] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._browser_lock = asyncio.Lock()
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def run(self) -> None:
+        """
+        Start the status endpoint and all job schedules, and run until cancelled.
+        """
+        self._started_at = time.time()
+        self._conn = sqlite3.connect(self.db_filename)
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                if any(job.use_playwright for job in self.jobs):
+                    self._playwright = await stack.enter_async_context(async_playwright())
+                    await self._get_browser()
+
+                server = await asyncio.start_server(
+                    self._handle_status, self.status_host, self.status_port
+                )
+                await stack.enter_async_context(server)
+                logger.info("Status endpoint on http://%s:%d", self.status_host, self.status_port)
+
+                try:
+                    await asyncio.gather(*(self._schedule(job) for job in self.jobs))
+                finally:
+                    for task in self._tasks:
+                        task.cancel()
+                    await asyncio.gather(*self._tasks, return_exceptions=True)
+                    if self._browser is not None:
+                        await self._browser.close()
+                        self._browser = None
+        finally:
+            await close_client()
+            self._conn.close()
+            self._conn = None
+
+    async def _get_browser(self) -> Browser:
+        """
+        Return the warm browser, relaunching it if it has disconnected.
+
+        Concurrent fetches share the lock so a disconnect leads to exactly
+        one relaunch.
+        """
+        async with self._browser_lock:
+            if self._browser is None or not self._browser.is_connected():
+                logger.info("Launching Chromium")
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            return self._browser
+
+    async def _schedule(self, job: Job) -> None:
+        """
+        Trigger a job every interval (plus jitter), skipping overlapping runs.
+        """
+        status = self.status[job.name]
+        delay = random.uniform(0, job.jitter)
+        while True:
+            status.next_run = time.time() + delay
+            await asyncio.sleep(delay)
+            delay = job.interval + random.uniform(0, job.jitter)
+
+            if status.running:
+                status.skipped += 1
+                logger.warning("Job %s still running; skipping this run", job.name)
+                continue
+
+            # Mark running before the task starts so the next tick sees it.
+            status.running = True
+            task = asyncio.create_task(self._run_job(job))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_job(self, job: Job) -> None:
+        """
+        Scrape every URL in the job concurrently and record the outcome.
+        """
+        status = self.status[job.name]
+        status.last_started = time.time()
+        try:
+            results = await asyncio.gather(
+                *(self._scrape_url(job, url) for url in job.urls),
+                return_exceptions=True,
+            )
+            errors = [r for r in results if isinstance(r, Exception)]
+            for url, result in zip(job.urls, results):
+                if isinstance(result, Exception):
+                    logger.error("Job %s failed for %s: %s", job.name, url, result)
+            status.last_rows = sum(r for r in results if isinstance(r, int))
+            status.last_error = str(errors[-1]) if errors else None
+            if errors:
+                status.failures += 1
+        finally:
+            status.runs += 1
+            status.running = False
+            status.last_finished = time.time()
+            status.last_duration = status.last_finished - status.last_started
+
+    async def _scrape_url(self, job: Job, url: str) -> int:
+        """
+        Run the pipeline for one URL and return the number of rows stored.
+        """
+        if job.use_playwright:
+            html = await fetch_stats_html(url, get_browser=self._get_browser)
+        else:
+            html = await fetch_html(url)
+
+        # Parsing is CPU bound; keep the event loop free for the status endpoint.
+        spec = get_nba_spec(url)
+        normalized = await asyncio.to_thread(extract_stats, html, spec, url)
+        # Each site has its own columns, so each gets its own table.
+        insert_rows(normalized, conn=self._conn, table_name=f"{spec.site.replace('-', '_')}_stats")
+        return len(normalized)
+
+    def _snapshot(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Build the JSON body for a status path, or None if unknown.
+        """
+        if path == "/health":
+            return {"status": "ok", "uptime": time.time() - self._started_at}
+        if path == "/status":
+            return {name: asdict(status) for name, status in self.status.items()}
+        return None
+
+    async def _handle_status(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Minimal HTTP/1.0 handler for the status endpoint.
+        """
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            # Drain request headers.
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            body = None
+            if len(request_line) >= 2 and request_line[0] == "GET":
+                body = self._snapshot(request_line[1].split("?", 1)[0])
+
+            if body is None:
+                status_line, payload = "404 Not Found", {"error": "not found"}
+            else:
+                status_line, payload = "200 OK", body
+            data = json.dumps(payload).encode("utf-8")
+            writer.write(
+                f"HTTP/1.0 {status_line}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+def run_daemon(jobs: List[Job], **kwargs: Any) -> None:
+    """
+    Synchronous entry point for running the daemon until interrupted.
+    """
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(ScraperDaemon(jobs, **kwargs).run())
+
+
+# Default schedule used when running this module directly.
+DEFAULT_JOBS: List[Job] = [
+    Job(
+        name="realgm_stats",
+        urls=["https://basketball.realgm.com/nba/stats"],
+        interval=15 * 60,
+        jitter=60,
+        use_playwright=True,
+    ),
+]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run_daemon(DEFAULT_JOBS)
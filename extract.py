@@ -0,0 +1,249 @@
+"""
+Generic, spec-driven table extraction.
+
+Each site is described by a declarative ExtractionSpec (table locator,
+header row, data rows, column mapping and type hints). A spec is compiled
+once into an ExtractionPlan holding lxml XPath/CSS objects and a
+normalisation plan, and plans are cached by (site, version). Adding a site
+means adding a spec, not another hand-written parser.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import lxml.html
+from lxml import etree
+
+from .normalize import TYPE_COERCERS, to_snake_case
+from .parse import cell_text
+
+
+@dataclass(frozen=True)
+class ExtractionSpec:
+    """
+    Declarative description of a stats table on one site.
+
+    Selectors are XPath expressions unless selector_type is "css", in which
+    case `table` is a CSS selector (requires the `cssselect` package). The
+    row and cell selectors are always XPath, relative to the table/row.
+
+    Attributes:
+        site: Site identifier, used with version as the plan cache key.
+        version: Bump whenever the spec changes so cached plans are rebuilt.
+        table: Selector for candidate tables.
+        header_row: Relative XPath; the first match is the header row.
+        data_rows: Relative XPath selecting the data rows of the table.
+        header_cells: Relative XPath selecting header cells in the header row.
+        data_cells: Relative XPath selecting cells in a data row.
+        required_headers: A candidate table matches if any of these headers
+            is present. Empty means the first candidate is used.
+        columns: (header text, output key) pairs. Unmapped headers are
+            converted to snake_case; one that reduces to nothing (e.g. "#")
+            becomes "rank" unless a mapping already produces "rank", in
+            which case the column is dropped. Columns with a blank header
+            (spacer columns) are always dropped, and repeated header text
+            gets a numeric suffix ("FG%", "FG%_2") so no column is merged.
+        types: (output key, type hint) pairs; hints are keys of
+            normalize.TYPE_COERCERS. Unlisted keys use "auto".
+        selector_type: "xpath" (default) or "css"; applies to `table` only.
+        search_comments: Also look for the table inside HTML comments,
+            where some sites ship tables that are revealed by JS.
+        joined_tables: Optional relative XPath, evaluated on the located
+            table, selecting further tables whose columns continue it, for
+            sites that split one logical table into a fixed and a scrolling
+            part. Their header and data cells are appended row by row.
+    """
+
+    site: str
+    version: int
+    table: str
+    header_row: str
+    data_rows: str
+    header_cells: str = "./th|./td"
+    data_cells: str = "./td"
+    required_headers: Tuple[str, ...] = ()
+    columns: Tuple[Tuple[str, str], ...] = ()
+    types: Tuple[Tuple[str, str], ...] = ()
+    selector_type: str = "xpath"
+    search_comments: bool = False
+    joined_tables: Optional[str] = None
+
+
+class ExtractionPlan:
+    """
+    A compiled ExtractionSpec, reusable across pages.
+    """
+
+    def __init__(self, spec: ExtractionSpec) -> None:
+        self.spec = spec
+
+        if spec.selector_type == "xpath":
+            self._find_tables: Callable = etree.XPath(spec.table)
+        elif spec.selector_type == "css":
+            from lxml.cssselect import CSSSelector
+            self._find_tables = CSSSelector(spec.table)
+        else:
+            raise ValueError(f"Unknown selector type: {spec.selector_type!r}")
+
+        self._header_row = etree.XPath(spec.header_row)
+        self._data_rows = etree.XPath(spec.data_rows)
+        self._header_cells = etree.XPath(spec.header_cells)
+        self._data_cells = etree.XPath(spec.data_cells)
+        self._joined_tables = etree.XPath(spec.joined_tables) if spec.joined_tables else None
+        self._required = set(spec.required_headers)
+
+        self._column_keys = dict(spec.columns)
+        self._key_types = dict(spec.types)
+        unknown = set(self._key_types.values()) - TYPE_COERCERS.keys()
+        if unknown:
+            raise ValueError(f"Unknown type hints in {spec.site} spec: {sorted(unknown)}")
+        self._rank_mapped = "rank" in self._column_keys.values()
+        # header text -> (output key, coercer), or None to drop the column;
+        # filled lazily as headers are seen.
+        self._header_plan: Dict[str, Optional[Tuple[str, Callable[[str], Any]]]] = {}
+
+    def _headers(self, table: etree._Element) -> List[str]:
+        header_rows = self._header_row(table)
+        if not header_rows:
+            return []
+        return [cell_text(cell) for cell in self._header_cells(header_rows[0])]
+
+    def _locate(self, root: etree._Element) -> Optional[Tuple[etree._Element, List[str]]]:
+        for table in self._find_tables(root):
+            headers = self._headers(table)
+            if headers and (not self._required or self._required.intersection(headers)):
+                return table, headers
+        return None
+
+    def extract(self, html: str) -> List[Dict[str, str]]:
+        """
+        Extract raw rows from a page, keyed by header text.
+
+        Raises:
+            ValueError: If no table matching the spec is found.
+        """
+        root = lxml.html.document_fromstring(html)
+        located = self._locate(root)
+
+        if located is None and self.spec.search_comments:
+            for comment in root.iter(etree.Comment):
+                if "<table" not in (comment.text or ""):
+                    continue
+                located = self._locate(lxml.html.fragment_fromstring(comment.text, create_parent="div"))
+                if located is not None:
+                    break
+
+        if located is None:
+            raise ValueError(f"No {self.spec.site} stats table found. Page structure may have changed.")
+
+        table, headers = located
+        tables = [table]
+        if self._joined_tables is not None:
+            for joined in self._joined_tables(table):
+                tables.append(joined)
+                headers = headers + self._headers(joined)
+
+        row_groups = [self._data_rows(t) for t in tables]
+        if len({len(group) for group in row_groups}) > 1:
+            raise ValueError(f"Joined {self.spec.site} tables have different row counts. Page structure may have changed.")
+
+        columns = self._columns(headers)
+        rows: List[Dict[str, str]] = []
+        for trs in zip(*row_groups):
+            cell_texts = [cell_text(cell) for tr in trs for cell in self._data_cells(tr)]
+            if len(cell_texts) != len(headers) or cell_texts == headers:
+                # skip malformed rows and repeated header rows
+                continue
+            rows.append({name: cell_texts[i] for i, name in columns})
+        return rows
+
+    @staticmethod
+    def _columns(headers: List[str]) -> List[Tuple[int, str]]:
+        """
+        Pair each kept column index with a unique name, dropping blank headers.
+        """
+        columns: List[Tuple[int, str]] = []
+        seen: Dict[str, int] = {}
+        for i, header in enumerate(headers):
+            if not header:
+                continue
+            seen[header] = seen.get(header, 0) + 1
+            columns.append((i, header if seen[header] == 1 else f"{header}_{seen[header]}"))
+        return columns
+
+    def _plan_for(self, header: str) -> Optional[Tuple[str, Callable[[str], Any]]]:
+        if header in self._header_plan:
+            return self._header_plan[header]
+        key = self._column_keys.get(header) or to_snake_case(header)
+        if not key and not self._rank_mapped:
+            key = "rank"
+        plan = (key, TYPE_COERCERS[self._key_types.get(key, "auto")]) if key else None
+        self._header_plan[header] = plan
+        return plan
+
+    def normalize(self, rows: List[Dict[str, str]], source_url: str) -> List[Dict[str, Any]]:
+        """
+        Apply the column mapping and type hints to raw rows.
+        """
+        normalized: List[Dict[str, Any]] = []
+        for row in rows:
+            clean_row: Dict[str, Any] = {"source": source_url}
+            for header, value in row.items():
+                plan = self._plan_for(header)
+                if plan is None:
+                    continue
+                key, coerce = plan
+                clean_row[key] = coerce(value)
+            normalized.append(clean_row)
+        return normalized
+
+
+_PLAN_CACHE: Dict[Tuple[str, int], ExtractionPlan] = {}
+
+
+def compile_spec(spec: ExtractionSpec) -> ExtractionPlan:
+    """
+    Return the compiled plan for a spec, compiling it on first use.
+
+    Plans are cached by (site, version).
+    """
+    key = (spec.site, spec.version)
+    plan = _PLAN_CACHE.get(key)
+    if plan is None:
+        plan = ExtractionPlan(spec)
+        _PLAN_CACHE[key] = plan
+    return plan
+
+
+def extract_stats(html: str, spec: ExtractionSpec, source_url: str) -> List[Dict[str, Any]]:
+    """
+    Extract and normalize the stats table described by spec.
+
+    Input:
+        html (str): Page HTML from any fetcher
+        spec (ExtractionSpec): Site spec, e.g. from nba_specs.get_nba_spec
+        source_url (str): URL recorded in each row's "source" field
+
+    Output:
+        List of normalized dicts, one per table row
+    """
+    plan = compile_spec(spec)
+    return plan.normalize(plan.extract(html), source_url)
+
+
+if __name__ == "__main__":
+    from .nba_specs import REALGM_SPEC
+
+    example_html = """
+    <table>
+        <thead>
+            <tr><th>#</th><th>Player</th><th>FG%</th><th>3PA</th><th>Team</th></tr>
+        </thead>
+        <tbody>
+            <tr><td>1</td><td>LeBron James</td><td>52.3</td><td>8</td><td>LAL</td></tr>
+            <tr><td>2</td><td>Stephen Curry</td><td>48.1</td><td>10</td><td>GSW</td></tr>
+        </tbody>
+    </table>
+    """
+    for row in extract_stats(example_html, REALGM_SPEC, "https://basketball.realgm.com/nba/stats"):
+        print(row)
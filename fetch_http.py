@@ -1,6 +1,6 @@
 import aiohttp
 import asyncio
-from typing import Optional, Dict
+from typing import AsyncIterator, Optional, Dict
 from .headers.nba_headers import get_nba_headers
 
 async def fetch_html(url: str, headers: Optional[Dict[str, str]] = None) -> str:
@@ -25,6 +25,61 @@ async def fetch_html(url: str, headers: Optional[Dict[str, str]] = None) -> str:
             return await response.text()
 
 
+class HTMLStream:
+    """
+    Async iterable over the raw body chunks of a webpage, fetched with aiohttp.
+
+    Unlike fetch_html, the body is never materialised as a single string,
+    so chunks can be handed to an incremental parser while the rest of the
+    page is still downloading. The charset from the response's Content-Type
+    header is exposed as `charset` once the response arrives, i.e. before
+    the first chunk is yielded. Like response.text(), it falls back to
+    UTF-8 when the header carries no charset.
+
+    Raises:
+        aiohttp.ClientError: If the HTTP request fails.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = 64 * 1024,
+    ) -> None:
+        self.url = url
+        self.headers = headers if headers is not None else get_nba_headers(url)
+        self.chunk_size = chunk_size
+        self.charset: Optional[str] = None
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async with aiohttp.ClientSession(headers=self.headers) as session:
+            async with session.get(self.url, timeout=20) as response:
+                response.raise_for_status()
+                self.charset = response.charset or "utf-8"
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    yield chunk
+
+
+def stream_html(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    chunk_size: int = 64 * 1024,
+) -> HTMLStream:
+    """
+    Stream the body of a webpage as raw byte chunks using aiohttp.
+
+    Args:
+        url (str): The URL to fetch.
+        headers (Optional[Dict[str, str]]): Optional HTTP headers.
+        chunk_size (int): Maximum size of each yielded chunk in bytes.
+
+    Returns:
+        HTMLStream: Async iterable of decoded (decompressed) body chunks in
+        arrival order, carrying the response charset.
+    """
+    return HTMLStream(url, headers=headers, chunk_size=chunk_size)
+
+
 # --- Debug entry point ---
 if __name__ == "__main__":
     TEST_URL = "https://basketball.realgm.com/nba/stats"
@@ -1,18 +1,52 @@
 import asyncio
-from playwright.async_api import async_playwright, Error as PlaywrightError
+from typing import Awaitable, Callable, Optional
+from playwright.async_api import async_playwright, Browser, Error as PlaywrightError
 from .headers.nba_headers import get_nba_headers
 
 
+async def _render(page, url: str, wait_for_selector: Optional[str], verbose: bool) -> str:
+    """
+    Navigate an open page to the URL and return its rendered HTML.
+    """
+    await page.set_extra_http_headers(get_nba_headers(url))
+
+    if verbose:
+        print(f"Navigating to {url}")
+    await page.goto(
+        url,
+        wait_until="domcontentloaded",
+        timeout=60000
+    )
+
+    if wait_for_selector:
+        if verbose:
+            print(f"Waiting for selector: {wait_for_selector}")
+        await page.wait_for_selector(wait_for_selector, timeout=60000)
+        element = await page.query_selector(wait_for_selector)
+        return await element.inner_html() if element else ""
+
+    # Temporary: allow JS to finish injecting content (debug/discovery phase)
+    await page.wait_for_timeout(5000)
+    return await page.content()
+
+
 async def fetch_stats_html(
     url: str,
     wait_for_selector: str = None,
     headless: bool = True,
     retries: int = 3,
-    verbose: bool = False
+    verbose: bool = False,
+    get_browser: Optional[Callable[[], Awaitable[Browser]]] = None
 ) -> str:
     """
     Fetch rendered HTML for a RealGM stats page using Playwright.
 
+    If get_browser is passed, it is awaited on every attempt for an already
+    launched browser; a new page is opened on it and closed afterwards,
+    leaving the browser running for reuse. Asking again per attempt lets
+    the owner replace a browser that disconnected mid-run. Otherwise a
+    browser is launched and closed for this call.
+
     This function is part of the scraping pipeline and should NOT
     contain print statements or debugging logic.
     """
@@ -21,35 +55,20 @@ async def fetch_stats_html(
         try:
             if verbose:
                 print(f"Attempt {attempt + 1} to fetch {url}")
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=headless)
-                page = await browser.new_page()
-
+            if get_browser is not None:
+                page = await (await get_browser()).new_page()
                 try:
-                    await page.set_extra_http_headers(get_nba_headers(url))
-
-                    if verbose:
-                        print(f"Navigating to {url}")
-                    await page.goto(
-                        url,
-                        wait_until="domcontentloaded",
-                        timeout=60000
-                    )
-
-                    if wait_for_selector:
-                        if verbose:
-                            print(f"Waiting for selector: {wait_for_selector}")
-                        await page.wait_for_selector(wait_for_selector, timeout=60000)
-                        element = await page.query_selector(wait_for_selector)
-                        html = await element.inner_html() if element else ""
-                    else:
-                        # Temporary: allow JS to finish injecting content (debug/discovery phase)
-                        await page.wait_for_timeout(5000)
-                        html = await page.content()
+                    return await _render(page, url, wait_for_selector, verbose)
                 finally:
-                    await browser.close()
+                    await page.close()
 
-            return html
+            async with async_playwright() as p:
+                launched = await p.chromium.launch(headless=headless)
+                try:
+                    page = await launched.new_page()
+                    return await _render(page, url, wait_for_selector, verbose)
+                finally:
+                    await launched.close()
         except (PlaywrightError, asyncio.TimeoutError) as e:
             if verbose:
                 print(f"Error on attempt {attempt + 1}: {e}")
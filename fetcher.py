@@ -1,15 +1,19 @@
 import asyncio
 from .fetch_http import fetch_html
+from .fetch_httpx import fetch_html as fetch_html_httpx
 from .fetch_playwright import fetch_stats_html
 from .headers.nba_headers import get_nba_headers
 
-async def fetch(url: str, use_playwright: bool = False) -> str:
+async def fetch(url: str, use_playwright: bool = False, http_backend: str = "aiohttp") -> str:
     """
     Fetch HTML content from a URL using either HTTP or Playwright.
 
     Args:
         url (str): The URL to fetch.
         use_playwright (bool): Whether to use Playwright for fetching. Defaults to False.
+        http_backend (str): HTTP client to use when not using Playwright:
+            "aiohttp" (HTTP/1.1) or "httpx" (HTTP/2, shared connection pool).
+            Defaults to "aiohttp".
 
     Returns:
         str: The fetched HTML content.
@@ -18,6 +22,10 @@ async def fetch(url: str, use_playwright: bool = False) -> str:
         return await fetch_stats_html(url)
     else:
         headers = get_nba_headers(url)
+        if http_backend == "httpx":
+            return await fetch_html_httpx(url, headers=headers)
+        if http_backend != "aiohttp":
+            raise ValueError(f"Unknown HTTP backend: {http_backend!r}")
         return await fetch_html(url, headers=headers)
 
 if __name__ == "__main__":
@@ -5,10 +5,15 @@ This file is intentionally kept thin. It delegates all real work to the
 `scrape` package so imports remain stable and testable.
 """
 
+import argparse
 import asyncio
+from typing import List, Optional
 from src.scrape.fetcher import fetch
-from src.scrape.parse import parse_realgm_stats
-from src.scrape.normalize import normalize_realgm_stats
+from src.scrape.fetch_http import stream_html
+from src.scrape.parse import parse_realgm_stats_stream
+from src.scrape.normalize import normalize_realgm_row
+from src.scrape.extract import extract_stats
+from src.scrape.nba_specs import get_nba_spec
 from src.scrape.storage import insert_rows
 from src.scrape.headers.nba_headers import get_nba_headers
 
@@ -18,20 +23,19 @@ async def run() -> None:
     Orchestrates the full scraping pipeline:
 
     1. Fetch RealGM stats page HTML (HTTP or Playwright).
-    2. Parse the HTML into structured rows.
-    3. Normalize the rows into a consistent schema.
-    4. Persist the normalized rows to storage.
+    2. Extract and normalize the stats table using the site's spec.
+    3. Persist the normalized rows to storage.
     """
 
-    headers = get_nba_headers("https://basketball.realgm.com/nba/stats")
+    url = "https://basketball.realgm.com/nba/stats"
+    headers = get_nba_headers(url)
 
     html = await fetch(
-        url="https://basketball.realgm.com/nba/stats",
+        url=url,
         use_playwright=True,
     )
 
-    rows = parse_realgm_stats(html)
-    normalized_rows = normalize_realgm_stats(rows)
+    normalized_rows = extract_stats(html, get_nba_spec(url), url)
 
     insert_rows(normalized_rows)
 
@@ -41,11 +45,46 @@ async def run() -> None:
         print(row)
 
 
-def main() -> None:
+async def run_streaming() -> None:
+    """
+    Streaming variant of the pipeline over plain HTTP.
+
+    Body chunks are parsed while the page is still downloading and each
+    row is normalized as soon as it is emitted, so the full HTML string
+    and soup tree are never held in memory.
+    """
+
+    url = "https://basketball.realgm.com/nba/stats"
+
+    normalized_rows = [
+        normalize_realgm_row(row, url)
+        async for row in parse_realgm_stats_stream(stream_html(url))
+    ]
+
+    insert_rows(normalized_rows)
+
+    # Lightweight verification output
+    print(f"Inserted {len(normalized_rows)} rows.")
+    for row in normalized_rows[:3]:
+        print(row)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """
     Synchronous entry point for CLI execution.
+
+    Pass --stream to run the streaming HTTP pipeline instead of the
+    default Playwright one.
     """
-    asyncio.run(run())
+    parser = argparse.ArgumentParser(description="Scrape RealGM NBA stats.")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="fetch over plain HTTP and parse rows while the page downloads",
+    )
+    args = parser.parse_args(argv)
+
+    asyncio.run(run_streaming() if args.stream else run())
 
 
 if __name__ == "__main__":
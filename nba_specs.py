@@ -0,0 +1,64 @@
+from .extract import ExtractionSpec
+
+REALGM_SPEC = ExtractionSpec(
+    site="realgm",
+    version=2,
+    table="//table",
+    # The first row naming Player or Team, so grouping rows above the real
+    # headers are skipped; they are then dropped as malformed data rows.
+    header_row="(.//tr[*[normalize-space()='Player' or normalize-space()='Team']])[1]",
+    data_rows=".//tr[td]",
+    required_headers=("Player", "Team"),
+    columns=(("#", "rank"),),
+    types=(("rank", "int"), ("player", "str"), ("team", "str")),
+)
+
+BASKETBALL_REFERENCE_SPEC = ExtractionSpec(
+    site="basketball-reference",
+    version=1,
+    table="//table[contains(@class, 'stats_table')]",
+    # Skip grouping rows such as "Shooting" / "Per Game" above the real headers.
+    header_row=".//thead/tr[not(contains(@class, 'over_header'))][last()]",
+    data_rows=".//tbody/tr[not(contains(@class, 'thead'))]",
+    data_cells="./th|./td",
+    required_headers=("Player", "Team", "Tm"),
+    columns=(("Rk", "rank"), ("Tm", "team"), ("Pos", "position")),
+    types=(("rank", "int"), ("player", "str"), ("team", "str"), ("position", "str"), ("age", "int")),
+    # Secondary tables are shipped inside HTML comments and revealed by JS.
+    search_comments=True,
+)
+
+ESPN_SPEC = ExtractionSpec(
+    site="espn",
+    version=2,
+    # Stats tables are split into a fixed-left part (RK, Name) and a
+    # scrolling part (POS, GP, PTS, ...) that continues it row by row.
+    table="//table[contains(@class, 'Table--fixed-left')]",
+    header_row="(.//thead/tr)[last()]",
+    data_rows=".//tbody/tr",
+    required_headers=("Name", "Player", "Team"),
+    columns=(("RK", "rank"), ("Name", "player"), ("POS", "position")),
+    types=(("rank", "int"), ("player", "str"), ("team", "str"), ("position", "str")),
+    joined_tables="following-sibling::*[1]/descendant-or-self::table[contains(@class, 'Table')]",
+)
+
+
+def get_nba_spec(site_url: str) -> ExtractionSpec:
+    """
+    Return the extraction spec for an NBA stats site based on the URL.
+
+    Args:
+        site_url (str): The URL of the NBA stats site.
+
+    Returns:
+        ExtractionSpec: The site's spec, defaulting to RealGM if unknown.
+    """
+    site_url_lower = site_url.lower()
+    if "realgm.com" in site_url_lower:
+        return REALGM_SPEC
+    elif "basketball-reference.com" in site_url_lower:
+        return BASKETBALL_REFERENCE_SPEC
+    elif "espn.com" in site_url_lower and "/nba" in site_url_lower:
+        return ESPN_SPEC
+    # Default to RealGM spec if unknown
+    return REALGM_SPEC
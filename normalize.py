@@ -1,8 +1,8 @@
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List
 import re
 
 
-def _to_snake_case(name: str) -> str:
+def to_snake_case(name: str) -> str:
     """
     Normalize column names like 'FG%' or '3PA' into snake_case keys.
     """
@@ -27,6 +27,71 @@ def _coerce_value(value: str) -> Any:
         return value
 
 
+def _coerce_int(value: str) -> Any:
+    """
+    Convert a scraped value into an int, tolerating thousands separators.
+    """
+    if value == "":
+        return None
+
+    try:
+        return int(value.replace(",", ""))
+    except ValueError:
+        return _coerce_value(value)
+
+
+def _coerce_float(value: str) -> Any:
+    """
+    Convert a scraped value into a float, tolerating thousands separators.
+    """
+    if value == "":
+        return None
+
+    try:
+        return float(value.replace(",", ""))
+    except ValueError:
+        return value
+
+
+def _coerce_str(value: str) -> Any:
+    """
+    Keep a scraped value as text, mapping empty cells to None.
+    """
+    return value if value != "" else None
+
+
+# Type hints usable in extraction specs, mapped to their coercion functions.
+TYPE_COERCERS: Dict[str, Callable[[str], Any]] = {
+    "auto": _coerce_value,
+    "int": _coerce_int,
+    "float": _coerce_float,
+    "str": _coerce_str,
+}
+
+
+def normalize_realgm_row(
+    row: Dict[str, str],
+    source_url: str = "https://basketball.realgm.com/nba/stats"
+) -> Dict[str, Any]:
+    """
+    Normalize a single parsed RealGM stat row.
+
+    Used directly by the streaming pipeline so rows can be normalized
+    as soon as they are parsed.
+    """
+    clean_row: Dict[str, Any] = {
+        "source": source_url
+    }
+
+    for key, value in row.items():
+        norm_key = to_snake_case(key)
+        if norm_key == "":
+            norm_key = "rank"
+        clean_row[norm_key] = _coerce_value(value)
+
+    return clean_row
+
+
 def normalize_realgm_stats(
     rows: List[Dict[str, str]],
     source_url: str = "https://basketball.realgm.com/nba/stats"
@@ -39,17 +104,7 @@ def normalize_realgm_stats(
     for row in rows:
         if not isinstance(row, dict):
             continue
-        clean_row: Dict[str, Any] = {
-            "source": source_url
-        }
-
-        for key, value in row.items():
-            norm_key = _to_snake_case(key)
-            if norm_key == "":
-                norm_key = "rank"
-            clean_row[norm_key] = _coerce_value(value)
-
-        normalized.append(clean_row)
+        normalized.append(normalize_realgm_row(row, source_url))
 
     return normalized
 
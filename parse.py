@@ -1,5 +1,6 @@
 from bs4 import BeautifulSoup
-from typing import List, Dict
+from lxml import etree
+from typing import AsyncIterable, AsyncIterator, List, Dict, Optional
 
 
 def parse_realgm_stats(html: str) -> List[Dict[str, str]]:
@@ -123,6 +124,99 @@ def parse_realgm_stats(html: str) -> List[Dict[str, str]]:
     return rows
 
 
+def cell_text(cell: etree._Element) -> str:
+    """
+    Mirror BeautifulSoup's get_text(strip=True) for an lxml element.
+    """
+    return "".join(text.strip() for text in cell.itertext())
+
+
+def _release(element: etree._Element) -> None:
+    """
+    Free a fully processed element and any earlier siblings so the
+    incremental tree does not grow with the page.
+    """
+    element.clear()
+    parent = element.getparent()
+    if parent is None:
+        return
+    while element.getprevious() is not None:
+        del parent[0]
+
+
+async def parse_realgm_stats_stream(
+    chunks: AsyncIterable[bytes],
+    encoding: Optional[str] = None,
+) -> AsyncIterator[Dict[str, str]]:
+    """
+    Incrementally parse the main NBA stats table from RealGM.
+
+    Chunks are pushed into an lxml feed parser and each row is yielded as
+    soon as its closing </tr> arrives, then released from the tree. Table
+    detection follows parse_realgm_stats: the first table containing a row
+    with a "Player" or "Team" cell is used, and that row supplies the
+    headers. There is no largest-table fallback, since that would require
+    buffering the whole document.
+
+    Input:
+        chunks: Raw HTML body chunks, e.g. from fetch_http.stream_html
+        encoding: Optional body encoding, overriding everything else. When
+            omitted, the `charset` attribute of chunks is used if present
+            (fetch_http.HTMLStream sets it from the Content-Type header,
+            defaulting to UTF-8), otherwise lxml detects it from the document
+
+    Output:
+        Async iterator of dicts, one per player row, keyed by column header
+    """
+    # Created on the first chunk, once the response charset is known.
+    parser: Optional[etree.HTMLPullParser] = None
+    expected_columns = {"Player", "Team"}
+    target_table: Optional[etree._Element] = None
+    headers: List[str] = []
+
+    def drain() -> List[Dict[str, str]]:
+        nonlocal target_table, headers
+        ready: List[Dict[str, str]] = []
+        for _, tr in parser.read_events():
+            table = next(tr.iterancestors("table"), None)
+            if target_table is None:
+                cell_texts = [cell_text(cell) for cell in tr.iter("th", "td")]
+                if table is not None and expected_columns.intersection(cell_texts):
+                    target_table = table
+                    headers = cell_texts
+            elif table is target_table:
+                cells = list(tr.iter("td"))
+                if len(cells) == len(headers):
+                    cell_texts = [cell_text(td) for td in cells]
+                    if cell_texts != headers:
+                        ready.append(dict(zip(headers, cell_texts)))
+            _release(tr)
+        return ready
+
+    def make_parser() -> etree.HTMLPullParser:
+        return etree.HTMLPullParser(
+            events=("end",),
+            tag="tr",
+            encoding=encoding or getattr(chunks, "charset", None),
+        )
+
+    async for chunk in chunks:
+        if parser is None:
+            parser = make_parser()
+        parser.feed(chunk)
+        for row in drain():
+            yield row
+
+    if parser is None:
+        parser = make_parser()
+    parser.close()
+    for row in drain():
+        yield row
+
+    if target_table is None:
+        raise ValueError("No headers found in RealGM stats table. Page structure may have changed.")
+
+
 if __name__ == "__main__":
     # Simple test for parse_realgm_stats
     example_html = """
@@ -25,8 +25,8 @@ from scrapy.crawler import CrawlerProcess
 
 from .fetch_playwright import fetch_stats_html
 from .headers.nba_headers import get_nba_headers
-from .parse import parse_realgm_stats
-from .normalize import normalize_realgm_stats
+from .extract import extract_stats
+from .nba_specs import get_nba_spec
 from .storage import insert_rows
 
 
@@ -79,8 +79,7 @@ class RealGMSpider(scrapy.Spider):
                 self.logger.error("Failed to save debug HTML: %s", e, exc_info=True)
 
         try:
-            rows = parse_realgm_stats(html)
-            normalized = normalize_realgm_stats(rows)
+            normalized = extract_stats(html, get_nba_spec(response.url), response.url)
         except Exception as e:
             self.logger.error("Exception during parse/normalize: %s", e, exc_info=True)
             return []
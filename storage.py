@@ -1,10 +1,14 @@
 import sqlite3
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 DB_FILENAME = "realgm_stats.db"
 TABLE_NAME = "realgm_stats"
 
-def create_table_if_not_exists(conn: sqlite3.Connection, sample_row: Dict[str, Any]) -> None:
+def create_table_if_not_exists(
+    conn: sqlite3.Connection,
+    sample_row: Dict[str, Any],
+    table_name: str = TABLE_NAME,
+) -> None:
     """
     Create a table in the database with columns based on the keys of the sample_row dictionary.
     If the table already exists, this function does nothing.
@@ -12,6 +16,7 @@ def create_table_if_not_exists(conn: sqlite3.Connection, sample_row: Dict[str, A
     Args:
         conn: The SQLite connection object.
         sample_row: A dictionary representing a normalized data row.
+        table_name: The table to create. Defaults to TABLE_NAME.
     """
     def get_column_type(value: Any) -> str:
         if isinstance(value, int):
@@ -23,7 +28,7 @@ def create_table_if_not_exists(conn: sqlite3.Connection, sample_row: Dict[str, A
 
     columns = ", ".join(f'"{key}" {get_column_type(value)}' for key, value in sample_row.items())
     create_table_sql = f"""
-    CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
+    CREATE TABLE IF NOT EXISTS "{table_name}" (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         {columns}
     );
@@ -31,30 +36,40 @@ def create_table_if_not_exists(conn: sqlite3.Connection, sample_row: Dict[str, A
     conn.execute(create_table_sql)
     conn.commit()
 
-def insert_rows(rows: List[Dict[str, Any]]) -> None:
+def insert_rows(
+    rows: List[Dict[str, Any]],
+    conn: Optional[sqlite3.Connection] = None,
+    table_name: str = TABLE_NAME,
+) -> None:
     """
     Insert multiple normalized rows into the database.
 
     Args:
         rows: A list of dictionaries, each representing a normalized data row.
+        conn: Optional open connection to reuse. If omitted, a connection to
+            DB_FILENAME is opened and closed for this call.
+        table_name: The table to insert into. Defaults to TABLE_NAME.
     """
     if not rows:
         return
 
-    conn = sqlite3.connect(DB_FILENAME)
+    owns_conn = conn is None
+    if owns_conn:
+        conn = sqlite3.connect(DB_FILENAME)
     try:
-        create_table_if_not_exists(conn, rows[0])
+        create_table_if_not_exists(conn, rows[0], table_name)
 
         keys = rows[0].keys()
         placeholders = ", ".join("?" for _ in keys)
         columns = ", ".join(f'"{key}"' for key in keys)
-        insert_sql = f"INSERT INTO {TABLE_NAME} ({columns}) VALUES ({placeholders})"
+        insert_sql = f'INSERT INTO "{table_name}" ({columns}) VALUES ({placeholders})'
 
         values = [tuple(str(row[key]) if row[key] is not None else None for key in keys) for row in rows]
         conn.executemany(insert_sql, values)
         conn.commit()
     finally:
-        conn.close()
+        if owns_conn:
+            conn.close()
 
 if __name__ == "__main__":
     # Debug entry point to test inserting sample data